@@ -3,6 +3,7 @@ from os import getenv
 from uuid import uuid4
 from textwrap import dedent
 from datetime import datetime
+from functools import lru_cache
 from typing import (
     List,
     Any,
@@ -36,6 +37,16 @@ from phi.utils.merge_dict import merge_dictionaries
 from phi.utils.timer import Timer
 
 
+@lru_cache(maxsize=None)
+def _get_json_schema_for_model(model: Type[BaseModel]) -> Optional[Dict[str, Any]]:
+    """Return the JSON schema for a pydantic model, cached per model class.
+
+    Schema generation is one of the larger recurring costs in pydantic, so cache it
+    instead of rebuilding the same schema every time an output_model prompt is built.
+    """
+    return model.model_json_schema()
+
+
 class Assistant(BaseModel):
     # -*- Assistant settings
     # LLM to use for this Assistant
@@ -503,7 +514,7 @@ class Assistant(BaseModel):
                 json_output_prompt += f"\n{json.dumps(self.output_model)}"
                 json_output_prompt += "\n</json_fields>"
             elif issubclass(self.output_model, BaseModel):
-                json_schema = self.output_model.model_json_schema()
+                json_schema = _get_json_schema_for_model(self.output_model)
                 if json_schema is not None:
                     output_model_properties = {}
                     json_schema_properties = json_schema.get("properties")
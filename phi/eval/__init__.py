@@ -0,0 +1 @@
+from phi.eval.eval import Eval, EvalResult, AccuracyResult, SemanticCache
@@ -0,0 +1,688 @@
+import os
+import re
+import json
+import random
+import asyncio
+import hashlib
+import logging
+from math import sqrt
+from itertools import count
+from pathlib import Path
+from functools import lru_cache
+from typing import Optional, Union, Callable, Dict, List, Tuple
+
+from pydantic import BaseModel, ConfigDict, field_validator, Field, ValidationError
+from rich.box import ROUNDED
+from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
+
+from phi.assistant import Assistant
+from phi.cli.console import console
+from phi.embedder.base import Embedder
+from phi.llm.message import Message
+from phi.utils.log import logger, set_log_level_to_debug
+from phi.utils.timer import Timer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore
+
+try:
+    from uuid import uuid7  # Python 3.14+: monotonically sortable and cheap
+
+    def _new_eval_id() -> str:
+        return str(uuid7())
+except ImportError:
+    # One entropy read at import plus a counter: avoids the per-call entropy read
+    # and UUID object construction of uuid4(), and keeps ids sortable in-process.
+    _eval_id_rand = random.Random(os.urandom(16))
+    _eval_id_hi = _eval_id_rand.getrandbits(64)
+    _eval_id_counter = count(_eval_id_rand.getrandbits(64))
+
+    def _new_eval_id() -> str:
+        return f"{_eval_id_hi:016x}-{next(_eval_id_counter) & 0xFFFFFFFFFFFFFFFF:016x}"
+
+
+# Model used for the default accuracy evaluator
+_DEFAULT_JUDGE_MODEL = "gpt-4"
+# Directory for cached accuracy results
+_DEFAULT_EVAL_CACHE_DIR: Path = Path.home().resolve().joinpath(".phi", "cache", "eval")
+
+
+class AccuracyResult(BaseModel):
+    score: int = Field(..., description="Accuracy Score between 1 and 10 assigned to the Assistant's answer.")
+    reason: str = Field(..., description="Reason for the accuracy score.")
+
+
+class EvalResult(BaseModel):
+    accuracy_score: int = Field(..., description="Accuracy Score between 1 and 10")
+    accuracy_reason: str = Field(..., description="Reason for the accuracy score")
+
+
+class SemanticCache(BaseModel):
+    """In-memory semantic cache of accuracy results, keyed by embedding similarity.
+
+    Returns a previously computed AccuracyResult when the cosine similarity between
+    the key embedding and a cached entry exceeds `similarity_threshold`, so the
+    judge call is skipped for near-duplicate evaluations. The key embedding covers
+    the question, the ideal answer and the answer, since the judge's verdict
+    depends on all three.
+    """
+
+    # Embedder used to embed cache keys
+    embedder: Embedder
+    # Minimum cosine similarity for a cache hit
+    similarity_threshold: float = 0.95
+    # Cached (embedding, result) entries
+    entries: List[Tuple[List[float], AccuracyResult]] = []
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @staticmethod
+    def _cosine_similarity(a: List[float], b: List[float]) -> float:
+        dot = 0.0
+        norm_a = 0.0
+        norm_b = 0.0
+        for x, y in zip(a, b):
+            dot += x * y
+            norm_a += x * x
+            norm_b += y * y
+        if norm_a == 0.0 or norm_b == 0.0:
+            return 0.0
+        return dot / sqrt(norm_a * norm_b)
+
+    def embed(self, key_text: str) -> List[float]:
+        return self.embedder.get_embedding(key_text)
+
+    def get(self, key_embedding: List[float]) -> Optional[AccuracyResult]:
+        best_similarity = 0.0
+        best_result: Optional[AccuracyResult] = None
+        for entry_embedding, entry_result in self.entries:
+            similarity = self._cosine_similarity(key_embedding, entry_embedding)
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_result = entry_result
+        if best_result is not None and best_similarity >= self.similarity_threshold:
+            return best_result
+        return None
+
+    def add(self, key_embedding: List[float], accuracy_result: AccuracyResult) -> None:
+        self.entries.append((key_embedding, accuracy_result))
+
+
+# Description template for the accuracy evaluator. Kept at module scope so the
+# literal is assembled once at import instead of once per evaluator construction.
+_JUDGE_TEMPLATE = """\
+You are an Evaluator tasked with comparing an AI Assistant's answer to the ideal answer for a given question.
+You will assess the similarity and accuracy of the Assistant's answer and provide a score on a scale of 1 to 10,
+where 10 indicates a perfect match to the ideal answer.
+
+Question:
+{question}
+
+Ideal Answer:
+{ideal_answer}
+
+Evaluation Criteria:
+1. Accuracy: How closely does the AI Assistant's answer match the ideal answer?
+2. Completeness: Does the AI Assistant's answer cover all key points mentioned in the ideal answer?
+3. Relevance: Does the AI Assistant's answer stay on topic and address the question asked?
+{guidelines_block}
+Scoring Guide:
+1-2: The answer is mostly incorrect or irrelevant.
+3-4: The answer contains some correct information but misses key points or includes significant inaccuracies.
+5-6: The answer is partially correct, covering some key points but lacking in completeness or accuracy.
+7-8: The answer is mostly correct and complete, with only minor inaccuracies or omissions.
+9-10: The answer is highly accurate and complete, closely matching the ideal answer.
+
+Provide a detailed analysis comparing the AI Assistant's answer to the ideal answer and justify your score.
+"""
+
+# JSON output instructions for judge paths that bypass Assistant.output_model
+_JUDGE_JSON_PROMPT = """\
+Provide your output as a JSON containing the following fields:
+<json_fields>
+["score", "reason"]
+</json_fields>
+Start your response with `{` and end it with `}`.
+Your output will be passed to json.loads() to convert it to a Python object.
+Make sure it only contains valid JSON."""
+
+# Matches the score field as soon as it appears in a streaming judge response
+_SCORE_PATTERN = re.compile(r'"score"\s*:\s*(\d+)')
+
+# Joined guideline blocks, memoized per unique guidelines tuple
+_guidelines_cache: Dict[Tuple[str, ...], str] = {}
+
+
+def _render_guidelines(accuracy_guidelines: Tuple[str, ...]) -> str:
+    if not accuracy_guidelines:
+        return ""
+    # Single concatenation, and the first guideline gets its `- ` bullet like the rest
+    return "\nThe AI Assistant's answer must follow these guidelines:\n- " + "\n- ".join(accuracy_guidelines) + "\n"
+
+
+@lru_cache(maxsize=128)
+def _build_evaluator_description(accuracy_guidelines: Tuple[str, ...], model: str) -> str:
+    """Build the description template for the accuracy evaluator.
+
+    The template only depends on the guidelines and the judge model, so it is cached
+    to avoid re-assembling the same multi-hundred-token prompt for every Eval.
+    The returned string has `{question}` and `{ideal_answer}` placeholders.
+    """
+    guidelines_block = _guidelines_cache.setdefault(accuracy_guidelines, _render_guidelines(accuracy_guidelines))
+    # The returned template is re-scanned by .format(question=..., ideal_answer=...),
+    # so escape any braces in the guidelines to keep them literal
+    return _JUDGE_TEMPLATE.format_map(
+        {
+            "question": "{question}",
+            "ideal_answer": "{ideal_answer}",
+            "guidelines_block": guidelines_block.replace("{", "{{").replace("}", "}}"),
+        }
+    )
+
+
+class Eval(BaseModel):
+    # Evaluation name
+    name: Optional[str] = None
+    # Evaluation UUID (autogenerated if not set)
+    eval_id: Optional[str] = Field(None, validate_default=True)
+    # Assistant to evaluate
+    assistant: Optional[Assistant] = None
+    # Question to evaluate
+    question: str
+    # Answer to evaluate (if not provided, the Assistant is run with the question)
+    answer: Optional[str] = None
+    # Ideal answer for the question
+    ideal_answer: str
+    # Result of the evaluation
+    result: Optional[EvalResult] = None
+
+    # Assistant used to evaluate the accuracy of the answer
+    accuracy_evaluator: Optional[Assistant] = None
+    # Guidelines for the accuracy evaluator
+    accuracy_guidelines: Optional[List[str]] = None
+    # Result of the accuracy evaluation
+    accuracy_result: Optional[AccuracyResult] = None
+
+    # Semantic cache that reuses accuracy results for near-duplicate evaluations
+    semantic_cache: Optional[SemanticCache] = None
+
+    # Stream the judge's output and parse it incrementally instead of blocking on the full response
+    stream_judge: bool = False
+
+    # Cache accuracy results on disk so identical evaluations skip the judge call
+    cache_result: bool = False
+    # Directory for cached accuracy results. Defaults to ~/.phi/cache/eval
+    cache_dir: Optional[Path] = None
+
+    # Save the result to a file. Accepts `{name}` and `{eval_id}` placeholders.
+    save_result_to_file: Optional[str] = None
+
+    # debug_mode=True enables debug logs
+    debug_mode: bool = Field(False, validate_default=True)
+
+    # Resolved save_result_to_file path, cached after the first save
+    _resolved_save_path: Optional[Path] = None
+
+    # validate_assignment stays off so the per-eval field assignments in run()
+    # do not re-validate; defer_build=False builds the validator at import
+    # instead of lazily on the first instantiation.
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, validate_assignment=False, extra="ignore", defer_build=False
+    )
+
+    @field_validator("eval_id", mode="before")
+    def set_eval_id(cls, v: Optional[str]) -> str:
+        return v or _new_eval_id()
+
+    @field_validator("debug_mode", mode="before")
+    def set_log_level(cls, v: bool) -> bool:
+        if v:
+            set_log_level_to_debug()
+            logger.debug("Debug logs enabled")
+        return v
+
+    def get_accuracy_evaluator(self) -> Assistant:
+        if self.accuracy_evaluator is not None:
+            return self.accuracy_evaluator
+
+        try:
+            from phi.llm.openai import OpenAIChat
+        except ImportError:
+            raise ImportError("`openai` is required for the accuracy evaluator, install using `pip install openai`")
+
+        description_template = _build_evaluator_description(
+            tuple(self.accuracy_guidelines) if self.accuracy_guidelines else (), _DEFAULT_JUDGE_MODEL
+        )
+        self.accuracy_evaluator = Assistant(
+            llm=OpenAIChat(model=_DEFAULT_JUDGE_MODEL),
+            description=description_template.format(question=self.question, ideal_answer=self.ideal_answer),
+            output_model=AccuracyResult,
+        )
+        return self.accuracy_evaluator
+
+    def _get_judge_model(self) -> str:
+        if self.accuracy_evaluator is not None and self.accuracy_evaluator.llm is not None:
+            return self.accuracy_evaluator.llm.model
+        return _DEFAULT_JUDGE_MODEL
+
+    def _accuracy_cache_key(self, answer: str) -> str:
+        guidelines = "\n".join(sorted(self.accuracy_guidelines)) if self.accuracy_guidelines else ""
+        payload = "||".join([self.question, self.ideal_answer, answer, guidelines, self._get_judge_model()])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_cache_dir(self) -> Path:
+        return self.cache_dir if self.cache_dir is not None else _DEFAULT_EVAL_CACHE_DIR
+
+    def _read_accuracy_result_from_cache(self, cache_key: str) -> Optional[AccuracyResult]:
+        cache_file = self._get_cache_dir().joinpath(f"{cache_key}.json")
+        if not cache_file.exists():
+            return None
+        try:
+            # msgspec decodes cached results considerably faster than stdlib json
+            if msgspec is not None:
+                cached_data = msgspec.json.decode(cache_file.read_bytes())
+            else:
+                cached_data = json.loads(cache_file.read_text())
+            # The cached data was validated before it was written, so skip re-validation
+            return AccuracyResult.model_construct(**cached_data)
+        except Exception as e:
+            logger.warning(f"Failed to read cached accuracy result: {e}")
+            return None
+
+    def _write_accuracy_result_to_cache(self, cache_key: str, accuracy_result: AccuracyResult) -> None:
+        try:
+            cache_dir = self._get_cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_dir.joinpath(f"{cache_key}.json").write_text(accuracy_result.model_dump_json())
+        except Exception as e:
+            logger.warning(f"Failed to cache accuracy result: {e}")
+
+    def _save_result(self) -> None:
+        """Write self.result to save_result_to_file if both are set."""
+        if self.result is None or self.save_result_to_file is None:
+            return
+        try:
+            # Resolve the template and create the parent dir once per instance
+            if self._resolved_save_path is None:
+                self._resolved_save_path = Path(self.save_result_to_file.format(name=self.name, eval_id=self.eval_id))
+                self._resolved_save_path.parent.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                # orjson serializes faster than pydantic's encoder and skips the text IO layer
+                self._resolved_save_path.write_bytes(orjson.dumps(self.result.model_dump(), option=orjson.OPT_INDENT_2))
+            else:
+                self._resolved_save_path.write_text(self.result.model_dump_json(indent=4))
+        except Exception as e:
+            logger.warning(f"Failed to save result to file: {e}")
+
+    def _judge_shares_assistant_model(self) -> bool:
+        """True if the assistant and the accuracy evaluator resolve to the same LLM model."""
+        if self.assistant is None or self.assistant.llm is None:
+            return False
+        if self.accuracy_evaluator is not None and self.accuracy_evaluator.llm is not None:
+            judge_llm = self.accuracy_evaluator.llm
+            return isinstance(self.assistant.llm, type(judge_llm)) and self.assistant.llm.model == judge_llm.model
+        try:
+            from phi.llm.openai import OpenAIChat
+        except ImportError:
+            return False
+        return isinstance(self.assistant.llm, OpenAIChat) and self.assistant.llm.model == _DEFAULT_JUDGE_MODEL
+
+    @staticmethod
+    def _parse_accuracy_result(json_resp: str) -> Optional[AccuracyResult]:
+        try:
+            return AccuracyResult.model_validate_json(json_resp)
+        except ValidationError:
+            # Check if response starts with ```json
+            if json_resp.startswith("```json"):
+                json_resp = json_resp.replace("```json\n", "").replace("\n```", "")
+                try:
+                    return AccuracyResult.model_validate_json(json_resp)
+                except ValidationError as exc:
+                    logger.warning(f"Failed to validate accuracy result: {exc}")
+        return None
+
+    def _run_judge_on_assistant_context(self, answer_to_evaluate: str) -> Optional[AccuracyResult]:
+        """Run the judge as a continuation of the assistant's conversation.
+
+        When the assistant and the judge use the same model, appending the judge
+        directive to the assistant's existing messages lets the provider reuse the
+        KV cache for the shared prefix, so only the directive is prefilled instead
+        of a fresh multi-hundred-token judge system prompt.
+        """
+        if self.assistant is None or self.assistant.llm is None:
+            return None
+
+        guidelines = ""
+        if self.accuracy_guidelines:
+            guidelines = "\nThe answer must follow these guidelines:\n- " + "\n- ".join(self.accuracy_guidelines) + "\n"
+
+        judge_directive = (
+            f"""\
+Now, act as an impartial Evaluator and rate the answer you gave above against the ideal answer below.
+Assess the similarity, completeness and accuracy of your answer compared to the ideal answer and provide
+a score on a scale of 1 to 10, where 10 indicates a perfect match to the ideal answer.
+
+Ideal Answer:
+{self.ideal_answer}
+{guidelines}
+"""
+            + _JUDGE_JSON_PROMPT
+        )
+
+        # Continue from the exact messages sent to the LLM so the prefix matches,
+        # without touching the assistant's memory.
+        judge_messages: List[Message] = list(self.assistant.memory.llm_messages)
+        # llm.response() appends the assistant's reply to the message list it is given
+        # and the Assistant stores that list, so the answer is usually already the tail
+        if not (
+            len(judge_messages) > 0
+            and judge_messages[-1].role == "assistant"
+            and judge_messages[-1].content == answer_to_evaluate
+        ):
+            judge_messages.append(Message(role="assistant", content=answer_to_evaluate))
+        judge_messages.append(Message(role="user", content=judge_directive))
+        try:
+            judge_response = self.assistant.llm.response(messages=judge_messages)
+        except Exception as e:
+            logger.warning(f"Failed to evaluate accuracy on the assistant context: {e}")
+            return None
+        return self._parse_accuracy_result(judge_response)
+
+    def _run_judge_streaming(self, answer_to_evaluate: str) -> Optional[AccuracyResult]:
+        """Stream the judge's output and parse it incrementally.
+
+        The score is resolved as soon as it appears in the stream and published as a
+        provisional self.accuracy_result, so it is readable (e.g. from a concurrent
+        task) while the usually longer reason is still downloading. The full payload
+        is still validated once the stream completes, and the early score doubles as
+        a fallback when that validation fails.
+        """
+        try:
+            from phi.llm.openai import OpenAIChat
+        except ImportError:
+            raise ImportError("`openai` is required for the accuracy evaluator, install using `pip install openai`")
+
+        description_template = _build_evaluator_description(
+            tuple(self.accuracy_guidelines) if self.accuracy_guidelines else (), _DEFAULT_JUDGE_MODEL
+        )
+        # Assistant cannot stream when output_model is set, so ask for raw JSON instead
+        streaming_evaluator = Assistant(
+            llm=OpenAIChat(model=_DEFAULT_JUDGE_MODEL),
+            description=description_template.format(question=self.question, ideal_answer=self.ideal_answer)
+            + "\n"
+            + _JUDGE_JSON_PROMPT,
+        )
+        judge_response = ""
+        early_score: Optional[int] = None
+        try:
+            for response_chunk in streaming_evaluator.run(answer_to_evaluate, stream=True):  # type: ignore
+                judge_response += response_chunk
+                if early_score is None:
+                    score_match = _SCORE_PATTERN.search(judge_response)
+                    if score_match is not None:
+                        early_score = int(score_match.group(1))
+                        logger.debug(f"Judge score received: {early_score}")
+                        # Provisional verdict while the reason is still streaming
+                        self.accuracy_result = AccuracyResult.model_construct(score=early_score, reason="")
+        except Exception as e:
+            logger.error(f"Failed to evaluate accuracy: {e}")
+            return None
+        accuracy_result = self._parse_accuracy_result(judge_response)
+        if accuracy_result is None and early_score is not None:
+            # The payload failed validation but the score parsed mid-stream;
+            # keep it, with the raw response standing in for the reason
+            logger.warning("Judge stream failed validation, keeping the early-parsed score")
+            accuracy_result = AccuracyResult.model_construct(score=early_score, reason=judge_response)
+        return accuracy_result
+
+    def run(self, answer: Optional[Union[str, Callable]] = None) -> Optional[EvalResult]:
+        logger.debug(f"*********** Evaluation Start: {self.eval_id} ***********")
+
+        answer_to_evaluate: Optional[str] = None
+        answer_from_assistant = False
+        if answer is None:
+            if self.answer is not None:
+                answer_to_evaluate = self.answer
+            elif self.assistant is not None:
+                logger.debug("Getting answer from assistant")
+                answer_to_evaluate = self.assistant.run(self.question, stream=False)  # type: ignore
+                answer_from_assistant = True
+        else:
+            if callable(answer):
+                logger.debug("Getting answer from callable")
+                answer_to_evaluate = answer()
+            else:
+                answer_to_evaluate = answer
+
+        if answer_to_evaluate is None:
+            raise ValueError("No answer to evaluate.")
+        self.answer = answer_to_evaluate
+
+        # One logging call with deferred %-formatting instead of one per line
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "************************ Evaluating ************************\n"
+                "Question: %s\n"
+                "Ideal Answer: %s\n"
+                "Answer: %s\n"
+                "************************************************************",
+                self.question,
+                self.ideal_answer,
+                answer_to_evaluate,
+            )
+
+        accuracy_cache_key: Optional[str] = None
+        accuracy_result: Optional[AccuracyResult] = None
+        if self.cache_result:
+            accuracy_cache_key = self._accuracy_cache_key(answer_to_evaluate)
+            accuracy_result = self._read_accuracy_result_from_cache(accuracy_cache_key)
+
+        semantic_key_embedding: Optional[List[float]] = None
+        if accuracy_result is None and self.semantic_cache is not None:
+            semantic_key_embedding = self.semantic_cache.embed(
+                f"{self.question} || {self.ideal_answer} || {answer_to_evaluate}"
+            )
+            accuracy_result = self.semantic_cache.get(semantic_key_embedding)
+
+        if accuracy_result is None:
+            logger.debug("Evaluating accuracy...")
+            # If the judge uses the same model as the assistant, ride the assistant's KV
+            # cache. Only worthwhile when the assistant produced the answer in this run
+            # (otherwise there is no prefix to reuse and the judge would not see the
+            # question), and never in place of an explicitly configured evaluator.
+            if (
+                self.accuracy_evaluator is None
+                and answer_from_assistant
+                and self.assistant is not None
+                and len(self.assistant.memory.llm_messages) > 0
+                and self._judge_shares_assistant_model()
+            ):
+                accuracy_result = self._run_judge_on_assistant_context(answer_to_evaluate)
+            if accuracy_result is None and self.stream_judge and self.accuracy_evaluator is None:
+                accuracy_result = self._run_judge_streaming(answer_to_evaluate)
+            if accuracy_result is None:
+                accuracy_evaluator = self.get_accuracy_evaluator()
+                try:
+                    accuracy_result = accuracy_evaluator.run(answer_to_evaluate, stream=False)  # type: ignore
+                except Exception as e:
+                    logger.error(f"Failed to evaluate accuracy: {e}")
+                    return None
+                # Assistant.run returns the raw string when the output fails validation
+                if not isinstance(accuracy_result, AccuracyResult):
+                    logger.warning(f"Judge returned an unparseable accuracy result: {accuracy_result}")
+                    return None
+            if self.cache_result and accuracy_cache_key is not None and accuracy_result is not None:
+                self._write_accuracy_result_to_cache(accuracy_cache_key, accuracy_result)
+            if self.semantic_cache is not None and semantic_key_embedding is not None and accuracy_result is not None:
+                self.semantic_cache.add(semantic_key_embedding, accuracy_result)
+        else:
+            logger.debug("Accuracy result loaded from cache")
+        self.accuracy_result = accuracy_result
+
+        if self.accuracy_result is not None:
+            # The data comes from the already validated AccuracyResult, so skip re-validation
+            self.result = EvalResult.model_construct(
+                accuracy_score=self.accuracy_result.score,
+                accuracy_reason=self.accuracy_result.reason,
+            )
+
+        # -*- Save result to file if save_result_to_file is set
+        self._save_result()
+
+        logger.debug(f"*********** Evaluation End: {self.eval_id} ***********")
+        return self.result
+
+    async def arun(self, answer: Optional[Union[str, Callable]] = None) -> Optional[EvalResult]:
+        logger.debug(f"*********** Async Evaluation Start: {self.eval_id} ***********")
+
+        answer_to_evaluate: Optional[str] = None
+        if answer is None:
+            if self.answer is not None:
+                answer_to_evaluate = self.answer
+            elif self.assistant is not None:
+                logger.debug("Getting answer from assistant")
+                answer_to_evaluate = await self.assistant.arun(self.question, stream=False)  # type: ignore
+        else:
+            if callable(answer):
+                logger.debug("Getting answer from callable")
+                answer_to_evaluate = answer()
+            else:
+                answer_to_evaluate = answer
+
+        if answer_to_evaluate is None:
+            raise ValueError("No answer to evaluate.")
+        self.answer = answer_to_evaluate
+
+        accuracy_cache_key: Optional[str] = None
+        accuracy_result: Optional[AccuracyResult] = None
+        if self.cache_result:
+            accuracy_cache_key = self._accuracy_cache_key(answer_to_evaluate)
+            accuracy_result = self._read_accuracy_result_from_cache(accuracy_cache_key)
+
+        semantic_key_embedding: Optional[List[float]] = None
+        if accuracy_result is None and self.semantic_cache is not None:
+            semantic_key_embedding = self.semantic_cache.embed(
+                f"{self.question} || {self.ideal_answer} || {answer_to_evaluate}"
+            )
+            accuracy_result = self.semantic_cache.get(semantic_key_embedding)
+
+        if accuracy_result is None:
+            logger.debug("Evaluating accuracy...")
+            accuracy_evaluator = self.get_accuracy_evaluator()
+            try:
+                accuracy_result = await accuracy_evaluator.arun(answer_to_evaluate, stream=False)  # type: ignore
+            except Exception as e:
+                logger.error(f"Failed to evaluate accuracy: {e}")
+                return None
+            # Assistant.arun returns the raw string when the output fails validation
+            if not isinstance(accuracy_result, AccuracyResult):
+                logger.warning(f"Judge returned an unparseable accuracy result: {accuracy_result}")
+                return None
+            if self.cache_result and accuracy_cache_key is not None and accuracy_result is not None:
+                self._write_accuracy_result_to_cache(accuracy_cache_key, accuracy_result)
+            if self.semantic_cache is not None and semantic_key_embedding is not None and accuracy_result is not None:
+                self.semantic_cache.add(semantic_key_embedding, accuracy_result)
+        else:
+            logger.debug("Accuracy result loaded from cache")
+        self.accuracy_result = accuracy_result
+
+        if self.accuracy_result is not None:
+            # The data comes from the already validated AccuracyResult, so skip re-validation
+            self.result = EvalResult.model_construct(
+                accuracy_score=self.accuracy_result.score,
+                accuracy_reason=self.accuracy_result.reason,
+            )
+
+        # -*- Save result to file if save_result_to_file is set
+        self._save_result()
+
+        logger.debug(f"*********** Async Evaluation End: {self.eval_id} ***********")
+        return self.result
+
+    @classmethod
+    async def arun_many(cls, evals: List["Eval"], concurrency: int = 16) -> List[Optional[EvalResult]]:
+        """Run multiple evaluations concurrently, bounded by a semaphore.
+
+        The per-eval cost is dominated by network round-trips, so running evals
+        concurrently gives a near-linear speedup up to the concurrency bound.
+        Keep `concurrency` below the rate limits of your LLM provider.
+
+        Evals with an identical (question, ideal_answer, answer, guidelines, judge
+        model) key share a single judge call and the verdict is broadcast to every
+        member of the group, so duplicated cases only pay for one evaluation.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded_arun(e: "Eval") -> Optional[EvalResult]:
+            async with semaphore:
+                return await e.arun()
+
+        # Group evals whose answer is already known; the first member of each group
+        # runs the judge, the rest reuse its verdict. Evals that still need the
+        # assistant for an answer cannot be keyed up front and run individually.
+        groups: Dict[str, List["Eval"]] = {}
+        ungrouped: List["Eval"] = []
+        for e in evals:
+            if e.answer is not None:
+                groups.setdefault(e._accuracy_cache_key(e.answer), []).append(e)
+            else:
+                ungrouped.append(e)
+
+        leaders = [group[0] for group in groups.values()]
+        await asyncio.gather(*(_bounded_arun(e) for e in [*ungrouped, *leaders]))
+
+        for group in groups.values():
+            leader = group[0]
+            # Covers both a failed leader run (None) and an unparseable verdict (raw string)
+            if not isinstance(leader.accuracy_result, AccuracyResult):
+                continue
+            for member in group[1:]:
+                member.accuracy_result = leader.accuracy_result
+                # The data comes from our own validated judge result, so skip re-validation
+                member.result = EvalResult.model_construct(
+                    accuracy_score=leader.accuracy_result.score,
+                    accuracy_reason=leader.accuracy_result.reason,
+                )
+                # Broadcast members skip arun(), so persist their result here
+                member._save_result()
+
+        return [e.result for e in evals]
+
+    def print_result(self, answer: Optional[Union[str, Callable]] = None) -> Optional[EvalResult]:
+        # Skip the spinner thread and table rendering when stdout is piped (CI logs, subprocess capture)
+        if not console.is_terminal:
+            return self.run(answer=answer)
+
+        response_timer = Timer()
+        response_timer.start()
+        with Progress(SpinnerColumn(spinner_name="dots"), TextColumn("{task.description}"), transient=True) as progress:
+            progress.add_task("Working...")
+            result: Optional[EvalResult] = self.run(answer=answer)
+        response_timer.stop()
+
+        if result is None:
+            logger.error("Evaluation failed")
+            return None
+
+        table = Table(box=ROUNDED, border_style="blue", show_header=False)
+        table.add_row("Question", self.question)
+        table.add_row("Answer", self.answer)
+        table.add_row("Ideal Answer", self.ideal_answer)
+        table.add_row("Accuracy Score", f"{str(result.accuracy_score)}/10")
+        table.add_row("Accuracy Reason", result.accuracy_reason)
+        table.add_row("Time Taken", f"{response_timer.elapsed:.1f}s")
+        console.print(table)
+
+        return result
+
+
+# Build the Eval validator at import so the first instantiation does not pay for it
+Eval.model_rebuild()
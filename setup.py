@@ -1,5 +1,22 @@
 # A minimal setup.py file for supporting editable installs
 
+import os
+
 from setuptools import setup
 
-setup()
+# Optionally compile the hot eval-loop modules with Cython for a CPU-side speedup.
+# Opt-in: install the `fast` extra and set PHIDATA_CYTHONIZE=1 when building.
+# The pure-Python modules remain the fallback when no compiled artifact is present.
+ext_modules = None
+if os.environ.get("PHIDATA_CYTHONIZE") == "1":
+    try:
+        from Cython.Build import cythonize
+
+        ext_modules = cythonize(
+            ["phi/eval/eval.py", "phi/utils/timer.py"],
+            compiler_directives={"language_level": "3"},
+        )
+    except ImportError:
+        pass
+
+setup(ext_modules=ext_modules)